@@ -8,7 +8,8 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Final
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Final, Protocol, TypeVar
 
 import voluptuous as vol  # type: ignore[import-untyped, unused-ignore]
 from homeassistant import config_entries
@@ -50,6 +51,11 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING: Final = object()  # sentinel for getattr(), as None is a valid value
+
+# keyed by id(descriptions), as descriptions (with dict fields) aren't hashable
+_DESCRIPTIONS_BY_CLASS: dict[tuple[int, type], tuple[Any, ...]] = {}
+
 
 CONFIG_SCHEMA = vol.All(
     cv.deprecated(DOMAIN, raise_if_present=False),
@@ -147,11 +153,22 @@ def async_register_domain_events(
     else:
         message_events_regex = None
 
+    # NOTE: events are fired even if nothing appears to listen for them, as
+    # MATCH_ALL listeners (e.g. recorder, logbook) will still consume them
+    async_fire = hass.bus.async_fire
+    message_event, learn_event = f"{DOMAIN}_message", f"{DOMAIN}_learn"
+
     @callback
-    def async_process_msg(msg: Message, *args: Any, **kwargs: Any) -> None:
+    def async_process_msg(msg: Message, prev_msg: Message | None = None) -> None:
         """Process a message from the event bus as pass it on."""
 
-        if message_events_regex and message_events_regex.search(f"{msg!r}"):
+        learn_device_id = broker.learn_device_id  # can change at any time
+        if not message_events_regex and not learn_device_id:
+            return  # the most common case: nothing to do
+
+        packet = str(msg._pkt)  # as per repr(msg), but only computed once
+
+        if message_events_regex and message_events_regex.search(packet):
             event_data = {
                 "dtm": msg.dtm.isoformat(),
                 "src": msg.src.id,
@@ -159,17 +176,17 @@ def async_register_domain_events(
                 "verb": msg.verb,
                 "code": msg.code,
                 "payload": msg.payload,
-                "packet": str(msg._pkt),
+                "packet": packet,
             }
-            hass.bus.async_fire(f"{DOMAIN}_message", event_data)
+            async_fire(message_event, event_data)
 
-        if broker.learn_device_id and broker.learn_device_id == msg.src.id:
+        if learn_device_id and learn_device_id == msg.src.id:
             event_data = {
                 "src": msg.src.id,
                 "code": msg.code,
-                "packet": str(msg._pkt),
+                "packet": packet,
             }
-            hass.bus.async_fire(f"{DOMAIN}_learn", event_data)
+            async_fire(learn_event, event_data)
 
     broker.client.add_msg_handler(async_process_msg)
 
@@ -237,11 +254,9 @@ class RamsesEntity(Entity):
             ATTR_ID: self._device.id,
         }
         if self.entity_description.ramses_cc_extra_attributes:
-            attrs |= {
-                k: getattr(self._device, v)
-                for k, v in self.entity_description.ramses_cc_extra_attributes.items()
-                if hasattr(self._device, v)
-            }
+            for k, v in self.entity_description.ramses_cc_extra_attributes.items():
+                if (val := getattr(self._device, v, _MISSING)) is not _MISSING:
+                    attrs[k] = val
         return attrs
 
     async def async_added_to_hass(self) -> None:
@@ -273,3 +288,27 @@ class RamsesEntityDescription(EntityDescription):
 
     # integration-specific attributes
     ramses_cc_extra_attributes: dict[str, str] | None = None  # TODO: may not be None?
+
+
+class _RamsesRFClassDescription(Protocol):
+    """A description of entities for the ramses_rf class(es) of device it applies to."""
+
+    @property
+    def ramses_rf_class(self) -> type | UnionType: ...
+
+
+_DescriptionT = TypeVar("_DescriptionT", bound=_RamsesRFClassDescription)
+
+
+def descriptions_for_class(  # noqa: UP047 (PEP 695 syntax would require py3.12)
+    descriptions: tuple[_DescriptionT, ...], rf_class: type[RamsesRFEntity]
+) -> tuple[_DescriptionT, ...]:
+    """Return the descriptions applicable to a class of device (in their order)."""
+
+    key = (id(descriptions), rf_class)
+    if (result := _DESCRIPTIONS_BY_CLASS.get(key)) is None:
+        result = _DESCRIPTIONS_BY_CLASS.setdefault(
+            key,
+            tuple(d for d in descriptions if issubclass(rf_class, d.ramses_rf_class)),
+        )
+    return result
@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 from types import UnionType
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.binary_sensor import (
     ENTITY_ID_FORMAT,
@@ -41,9 +41,9 @@ from ramses_rf.entity_base import Entity as RamsesRFEntity
 from ramses_rf.gateway import Gateway
 from ramses_rf.schemas import SZ_BLOCK_LIST, SZ_CONFIG, SZ_KNOWN_LIST, SZ_SCHEMA
 from ramses_rf.system.heat import Logbook, System
-from ramses_tx.const import SZ_BYPASS_POSITION, SZ_IS_EVOFW3
+from ramses_tx.const import SZ_BYPASS_POSITION, SZ_IS_EVOFW3, Code
 
-from . import RamsesEntity, RamsesEntityDescription
+from . import RamsesEntity, RamsesEntityDescription, descriptions_for_class
 from .broker import RamsesBroker
 from .const import (
     ATTR_ACTIVE_FAULTS,
@@ -54,8 +54,18 @@ from .const import (
     DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from ramses_tx.message import Message
+
+
 _LOGGER = logging.getLogger(__name__)
 
+_ENTITY_ID_PREFIX: Final = ENTITY_ID_FORMAT.format("")  # i.e. "binary_sensor."
+
+_NOW: tuple[int, dt] = (-1, dt.min)  # millisecond of loop time, dt.now() during it
+
+_SHRINK_KEYS: Final = frozenset(("alias", "class", "faked"))  # device hints to show
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -70,15 +80,40 @@ async def async_setup_entry(
         entities = [
             description.ramses_cc_class(broker, rf_device, description)
             for rf_device in devices
-            for description in BINARY_SENSOR_DESCRIPTIONS
-            if isinstance(rf_device, description.ramses_rf_class)
-            and hasattr(rf_device, description.ramses_rf_attr)
+            for description in descriptions_for_class(
+                BINARY_SENSOR_DESCRIPTIONS, type(rf_device)
+            )
+            if hasattr(rf_device, description.ramses_rf_attr)
         ]
         async_add_entities(entities)
 
     broker.async_register_platform(platform, add_devices)
 
 
+def _dt_now(hass: HomeAssistant) -> dt:
+    """Return the current time, re-using it for the rest of this millisecond.
+
+    The loop time is still read every call, but a burst of state writes (e.g. after
+    an update) needs only one dt.now() (and its conversion to local time). The value
+    returned can be up to 1 ms stale.
+    """
+    global _NOW
+
+    key = int(hass.loop.time() * 1000)
+    if _NOW[0] != key:
+        _NOW = (key, dt.now())
+    return _NOW[1]
+
+
+def _shrink(device_hints: dict[str, bool | str]) -> dict[str, Any]:
+    """Return only the device hints worth showing (as gateway state attributes)."""
+    return {
+        k: v
+        for k, v in device_hints.items()
+        if k in _SHRINK_KEYS and v not in (None, False)
+    }
+
+
 class RamsesBinarySensor(RamsesEntity, BinarySensorEntity):
     """Representation of a generic binary sensor."""
 
@@ -94,9 +129,7 @@ class RamsesBinarySensor(RamsesEntity, BinarySensorEntity):
         _LOGGER.info("Found %r: %s", device, entity_description.key)
         super().__init__(broker, device, entity_description)
 
-        self.entity_id = ENTITY_ID_FORMAT.format(
-            f"{device.id}_{entity_description.key}"
-        )
+        self.entity_id = f"{_ENTITY_ID_PREFIX}{device.id}_{entity_description.key}"
         self._attr_unique_id = f"{device.id}-{entity_description.key}"
 
     @property
@@ -112,11 +145,8 @@ class RamsesBinarySensor(RamsesEntity, BinarySensorEntity):
     @property
     def icon(self) -> str:
         """Return the icon to use in the frontend, if any."""
-        return (
-            self.entity_description.icon
-            if self.is_on
-            else self.entity_description.icon_off
-        )
+        description = self.entity_description
+        return description.icon if self.is_on else description.icon_off
 
 
 class RamsesBatteryBinarySensor(RamsesBinarySensor):
@@ -133,16 +163,42 @@ class RamsesBatteryBinarySensor(RamsesBinarySensor):
         return super().extra_state_attributes | {ATTR_BATTERY_LEVEL: level}
 
 
-class RamsesLogbookBinarySensor(RamsesBinarySensor):
+class RamsesRecentMsgBinarySensor(RamsesBinarySensor):
+    """Representation of a binary sensor that depends upon a recent message."""
+
+    _MSG_MAX_AGE: float  # seconds for which a message is considered recent
+
+    _msg_expiry: tuple[Message, dt] | None = None  # msg, its expiry
+
+    def _msg_is_recent(self, msg: Message | None) -> bool:
+        """Return True if the message is less than _msg_max_age() seconds old.
+
+        The expiry is calculated once per message, leaving only a comparison.
+        """
+        if msg is None:
+            return False
+        if self._msg_expiry is None or self._msg_expiry[0] is not msg:
+            expiry = msg.dtm + timedelta(seconds=self._msg_max_age(msg))
+            self._msg_expiry = (msg, expiry)
+        return _dt_now(self.hass) < self._msg_expiry[1]
+
+    def _msg_max_age(self, msg: Message) -> float:
+        """Return the number of seconds for which the message is considered recent."""
+        return self._MSG_MAX_AGE
+
+
+class RamsesLogbookBinarySensor(RamsesRecentMsgBinarySensor):
     """Representation of a fault log."""
 
+    _MSG_MAX_AGE = 1200
+
     _device: Logbook
 
     @property
     def available(self) -> bool:
         """Return True if the device has been seen recently."""
-        msg = self._device._msgs.get("0418")
-        return msg and dt.now() - msg.dtm < timedelta(seconds=1200)
+        msg = self._device._msgs.get(Code._0418)
+        return self._msg_is_recent(msg)
 
     @property
     def is_on(self) -> bool:
@@ -150,7 +206,7 @@ class RamsesLogbookBinarySensor(RamsesBinarySensor):
         return bool(self._device.active_faults)
 
 
-class RamsesSystemBinarySensor(RamsesBinarySensor):
+class RamsesSystemBinarySensor(RamsesRecentMsgBinarySensor):
     """Representation of a system (a controller)."""
 
     _device: System
@@ -158,10 +214,12 @@ class RamsesSystemBinarySensor(RamsesBinarySensor):
     @property
     def available(self) -> bool:
         """Return True if the last system sync message is recent."""
-        msg = self._device._msgs.get("1F09")
-        return msg and dt.now() - msg.dtm < timedelta(
-            seconds=msg.payload["remaining_seconds"] * 3
-        )
+        msg = self._device._msgs.get(Code._1F09)
+        return self._msg_is_recent(msg)
+
+    def _msg_max_age(self, msg: Message) -> float:
+        """Return the max age of a recent system sync message (i.e. 3 sync cycles)."""
+        return msg.payload["remaining_seconds"] * 3
 
     @property
     def is_on(self) -> bool:
@@ -169,29 +227,24 @@ class RamsesSystemBinarySensor(RamsesBinarySensor):
         return not super().is_on  # TODO
 
 
-class RamsesGatewayBinarySensor(RamsesBinarySensor):
+class RamsesGatewayBinarySensor(RamsesRecentMsgBinarySensor):
     """Representation of a gateway (a HGI80)."""
 
+    _MSG_MAX_AGE = 300
+
     _device: HgiGateway
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the integration-specific state attributes."""
 
-        def shrink(device_hints: dict[str, bool | str]) -> dict[str, Any]:
-            return {
-                k: v
-                for k, v in device_hints.items()
-                if k in ("alias", "class", "faked") and v not in (None, False)
-            }
-
         gwy: Gateway = self._device._gwy
 
         return super().extra_state_attributes | {
             SZ_SCHEMA: {gwy.tcs.id: gwy.tcs._schema_min} if gwy.tcs else {},
             SZ_CONFIG: {"enforce_known_list": gwy._enforce_known_list},
-            SZ_KNOWN_LIST: [{k: shrink(v)} for k, v in gwy.known_list.items()],
-            SZ_BLOCK_LIST: [{k: shrink(v)} for k, v in gwy._exclude.items()],
+            SZ_KNOWN_LIST: [{k: _shrink(v)} for k, v in gwy.known_list.items()],
+            SZ_BLOCK_LIST: [{k: _shrink(v)} for k, v in gwy._exclude.items()],
             SZ_IS_EVOFW3: gwy._transport.get_extra_info(SZ_IS_EVOFW3),
         }
 
@@ -199,7 +252,7 @@ class RamsesGatewayBinarySensor(RamsesBinarySensor):
     def is_on(self) -> bool:
         """Return True if the gateway has received messages recently."""
         msg = self._device._gwy._this_msg
-        return not bool(msg and dt.now() - msg.dtm < timedelta(seconds=300))
+        return not self._msg_is_recent(msg)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Mapping
 from copy import deepcopy
 from datetime import datetime as dt, timedelta
 from threading import Semaphore
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, Final
 import voluptuous as vol  # type: ignore[import-untyped, unused-ignore]
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HassJob, HomeAssistant, ServiceCall
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import (
@@ -100,6 +100,11 @@ class RamsesBroker:
 
         self.learn_device_id: str | None = None  # TODO: can we do without this?
 
+        # re-used by the service handlers that schedule a follow-up update
+        self._update_job = HassJob(
+            self.async_update, "ramses_cc update", cancel_on_shutdown=True
+        )
+
     async def async_setup(self) -> None:
         """Set up the client, loading and checking state and config."""
         storage = await self._store.async_load() or {}
@@ -231,14 +236,14 @@ class RamsesBroker:
         return all(await asyncio.gather(*tasks))
 
     def _update_device(self, device: RamsesRFEntity) -> None:
-        if hasattr(device, "name") and device.name:
-            name = device.name
-        elif isinstance(device, System):
-            name = f"Controller {device.id}"
-        elif device._SLUG:
-            name = f"{device._SLUG} {device.id}"
-        else:
-            name = device.id
+        name: str | None = getattr(device, "name", None)  # a property: get it once
+        if not name:
+            if isinstance(device, System):
+                name = f"Controller {device.id}"
+            elif device._SLUG:
+                name = f"{device._SLUG} {device.id}"
+            else:
+                name = device.id
 
         if info := device._msg_value_code(Code._10E0):
             model = info.get("description")
@@ -348,7 +353,7 @@ class RamsesBroker:
             confirm_code=list(call.data["confirm"].keys()),
             ratify_cmd=cmd,
         )  # TODO: will need to re-discover schema
-        async_call_later(self.hass, _CALL_LATER_DELAY, self.async_update)
+        async_call_later(self.hass, _CALL_LATER_DELAY, self._update_job)
 
     async def async_force_update(self, _: ServiceCall) -> None:
         """Handle the force_update service call."""
@@ -358,13 +363,13 @@ class RamsesBroker:
     async def async_send_packet(self, call: ServiceCall) -> None:
         """Create a command packet and send it via the transport."""
 
-        kwargs = dict(call.data.items())  # is ReadOnlyDict
+        kwargs: Mapping[str, Any] = call.data  # is ReadOnlyDict, so copy if changing
         if (
-            call.data["device_id"] == "18:000730"
+            kwargs["device_id"] == "18:000730"
             and kwargs.get("from_id", "18:000730") == "18:000730"
             and self.client.hgi.id
         ):
-            kwargs["device_id"] = self.client.hgi.id
+            kwargs = {**kwargs, "device_id": self.client.hgi.id}
 
         cmd = self.client.create_cmd(**kwargs)
 
@@ -380,4 +385,4 @@ class RamsesBroker:
                 cmd._repr = None
 
         self.client.send_cmd(cmd)
-        async_call_later(self.hass, _CALL_LATER_DELAY, self.async_update)
+        async_call_later(self.hass, _CALL_LATER_DELAY, self._update_job)
@@ -542,7 +542,7 @@ class RamsesOptionsFlow(BaseRamsesFlow, OptionsFlow):
             if self.config_entry.state == ConfigEntryState.LOADED:
                 await self.hass.config_entries.async_unload(self.config_entry.entry_id)
 
-            store: Store = self.hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+            store = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
             storage: dict[str, Any] = await store.async_load() or {}
             if SZ_CLIENT_STATE in storage:
                 if user_input["clear_schema"]:
@@ -53,10 +53,9 @@ async def async_setup_entry(
     @callback
     def add_devices(devices: list[HvacRemote]) -> None:
         entities = [
-            RamsesRemoteEntityDescription.ramses_cc_class(
-                broker, device, RamsesRemoteEntityDescription()
-            )
+            description.ramses_cc_class(broker, device, description)
             for device in devices
+            for description in REMOTE_DESCRIPTIONS
         ]
         async_add_entities(entities)
 
@@ -222,3 +221,8 @@ class RamsesRemoteEntityDescription(RamsesEntityDescription, RemoteEntityDescrip
 
     # integration-specific attributes
     ramses_cc_class: type[RamsesRemote] = RamsesRemote
+
+
+REMOTE_DESCRIPTIONS: tuple[RamsesRemoteEntityDescription, ...] = (
+    RamsesRemoteEntityDescription(),
+)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import timedelta
 from typing import Any, Final, NewType
@@ -211,10 +213,29 @@ SCH_NO_ENTITY_SVC_PARAMS = cv.make_entity_service_schema(
 
 # services for ramses_cc integration
 
-_SCH_DEVICE_ID = cv.matches_regex(r"^[0-9]{2}:[0-9]{6}$")
-_SCH_CMD_CODE = cv.matches_regex(r"^[0-9A-F]{4}$")
-_SCH_DOM_IDX = cv.matches_regex(r"^[0-9A-F]{2}$")
-_SCH_COMMAND = cv.matches_regex(COMMAND_REGEX)
+
+def _fullmatch(regex: str) -> Callable[[Any], str]:
+    """Return a validator for strings that (fully) match a precompiled regex."""
+
+    fullmatch = re.compile(regex).fullmatch
+
+    def validator(value: Any) -> str:
+        if not isinstance(value, str):
+            raise vol.Invalid(f"not a string value: {value}")
+        if not fullmatch(value):
+            raise vol.Invalid(
+                f"value {value} does not match regular expression {regex}"
+            )
+        return value
+
+    return validator
+
+
+_SCH_DEVICE_ID = _fullmatch(r"[0-9]{2}:[0-9]{6}")
+_SCH_CMD_CODE = _fullmatch(r"[0-9A-F]{4}")
+_SCH_DOM_IDX = _fullmatch(r"[0-9A-F]{2}")
+_SCH_COMMAND = cv.matches_regex(COMMAND_REGEX)  # anchoring is as per ramses_tx
+_SCH_PAYLOAD = _fullmatch(r"([0-9A-F][0-9A-F]){1,48}")
 
 _SCH_BINDING = vol.Schema({vol.Required(_SCH_CMD_CODE): vol.Any(None, _SCH_DOM_IDX)})
 
@@ -232,10 +253,10 @@ SCH_BIND_DEVICE = vol.Schema(
 
 SCH_SEND_PACKET = vol.Schema(
     {
-        vol.Required(ATTR_DEVICE_ID): cv.matches_regex(r"^[0-9]{2}:[0-9]{6}$"),
+        vol.Required(ATTR_DEVICE_ID): _SCH_DEVICE_ID,
         vol.Required("verb"): vol.In((" I", "I", "RQ", "RP", " W", "W")),
-        vol.Required("code"): cv.matches_regex(r"^[0-9A-F]{4}$"),
-        vol.Required("payload"): cv.matches_regex(r"^([0-9A-F][0-9A-F]){1,48}$"),
+        vol.Required("code"): _SCH_CMD_CODE,
+        vol.Required("payload"): _SCH_PAYLOAD,
     }
 )
 
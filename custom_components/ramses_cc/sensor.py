@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from types import UnionType
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     ENTITY_ID_FORMAT,
@@ -85,13 +85,15 @@ from ramses_tx.const import (
     SZ_TEMPERATURE,
 )
 
-from . import RamsesEntity, RamsesEntityDescription
+from . import RamsesEntity, RamsesEntityDescription, descriptions_for_class
 from .broker import RamsesBroker
 from .const import ATTR_SETPOINT, DOMAIN, UnitOfVolumeFlowRate
 from .schemas import SVCS_RAMSES_SENSOR
 
 _LOGGER = logging.getLogger(__name__)
 
+_ENTITY_ID_PREFIX: Final = ENTITY_ID_FORMAT.format("")  # i.e. "sensor."
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -109,9 +111,8 @@ async def async_setup_entry(
         entities = [
             description.ramses_cc_class(broker, device, description)
             for device in devices
-            for description in SENSOR_DESCRIPTIONS
-            if isinstance(device, description.ramses_rf_class)
-            and hasattr(device, description.ramses_rf_attr)
+            for description in descriptions_for_class(SENSOR_DESCRIPTIONS, type(device))
+            if hasattr(device, description.ramses_rf_attr)
         ]
         async_add_entities(entities)
 
@@ -133,9 +134,7 @@ class RamsesSensor(RamsesEntity, SensorEntity):
         _LOGGER.info("Found %r: %s", device, entity_description.key)
         super().__init__(broker, device, entity_description)
 
-        self.entity_id = ENTITY_ID_FORMAT.format(
-            f"{device.id}_{entity_description.key}"
-        )
+        self.entity_id = f"{_ENTITY_ID_PREFIX}{device.id}_{entity_description.key}"
         self._attr_unique_id = f"{device.id}-{entity_description.key}"
 
     @property
@@ -0,0 +1,93 @@
+"""Tests for the binary sensors of ramses_cc."""
+
+from __future__ import annotations
+
+from datetime import datetime as dt, timedelta as td
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ramses_cc.binary_sensor import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    RamsesBinarySensor,
+    RamsesGatewayBinarySensor,
+    RamsesLogbookBinarySensor,
+    RamsesSystemBinarySensor,
+)
+from ramses_rf.schemas import SZ_BLOCK_LIST, SZ_KNOWN_LIST
+from ramses_tx.const import Code
+
+
+def _entity(hass: HomeAssistant, cls: type[RamsesBinarySensor]) -> RamsesBinarySensor:
+    """Return a binary sensor (of the given class) for a mocked device."""
+
+    description = next(
+        d for d in BINARY_SENSOR_DESCRIPTIONS if d.ramses_cc_class is cls
+    )
+    device = MagicMock(id="01:145038", _msgs={})
+
+    return cls(MagicMock(hass=hass), device, description)
+
+
+async def test_logbook_available(hass: HomeAssistant) -> None:
+    """Test the availability of a fault log, as per the age of its latest 0418."""
+
+    entity = _entity(hass, RamsesLogbookBinarySensor)
+    msgs = entity._device._msgs
+
+    assert not entity.available  # no message
+
+    msgs[Code._0418] = MagicMock(dtm=dt.now() - td(seconds=1260))
+    assert not entity.available  # an old message
+    assert not entity.available  # ...and again, via the cached expiry
+
+    msgs[Code._0418] = MagicMock(dtm=dt.now())
+    assert entity.available  # a fresh message, replacing the old one
+
+    msgs[Code._0418] = MagicMock(dtm=dt.now() - td(seconds=1260))
+    assert not entity.available  # an old message, replacing the fresh one
+
+
+async def test_system_available(hass: HomeAssistant) -> None:
+    """Test the availability of a system, as per the age of its latest 1F09."""
+
+    entity = _entity(hass, RamsesSystemBinarySensor)
+    msgs = entity._device._msgs
+
+    msg = MagicMock(dtm=dt.now() - td(seconds=150), payload={"remaining_seconds": 60})
+    msgs[Code._1F09] = msg
+    assert entity.available  # a fresh message (is recent for 3 x 60 seconds)
+
+    msg.payload = {}  # the max age is calculated only once per message
+    assert entity.available
+
+    msgs[Code._1F09] = MagicMock(
+        dtm=dt.now() - td(seconds=200), payload={"remaining_seconds": 60}
+    )
+    assert not entity.available  # an old message, replacing the fresh one
+
+
+async def test_gateway_device_lists(hass: HomeAssistant) -> None:
+    """Test the gateway's known/block lists reflect hints changed in place."""
+
+    entity = _entity(hass, RamsesGatewayBinarySensor)
+
+    gwy = entity._device._gwy
+    gwy.tcs = None
+    gwy.known_list = {"01:145038": {"class": "CTL"}, "13:237335": {}}
+    gwy._exclude = {"30:123456": {"faked": False}}
+
+    attrs = entity.extra_state_attributes
+    assert attrs[SZ_KNOWN_LIST] == [{"01:145038": {"class": "CTL"}}, {"13:237335": {}}]
+    assert attrs[SZ_BLOCK_LIST] == [{"30:123456": {}}]
+
+    # the same dicts, of the same length, but with hints that have changed
+    gwy.known_list["13:237335"] |= {"class": "BDR", "alias": "Boiler relay"}
+    gwy._exclude["30:123456"]["faked"] = True
+
+    attrs = entity.extra_state_attributes
+    assert attrs[SZ_KNOWN_LIST] == [
+        {"01:145038": {"class": "CTL"}},
+        {"13:237335": {"class": "BDR", "alias": "Boiler relay"}},
+    ]
+    assert attrs[SZ_BLOCK_LIST] == [{"30:123456": {"faked": True}}]
@@ -793,3 +793,46 @@ async def test_svc_send_packet(hass: HomeAssistant, entry: ConfigEntry) -> None:
     schemas = {SVC_SEND_PACKET: SCH_SEND_PACKET}
 
     await _test_service_call(hass, SVC_SEND_PACKET, data, schemas=schemas)
+
+
+_SEND_PACKET_GOOD = {
+    "device_id": "18:000730",
+    "verb": " I",
+    "code": "1FC9",
+    "payload": "00",
+}
+
+TESTS_SEND_PACKET_GOOD: dict[str, dict[str, Any]] = {
+    "00": {},
+    "01": {"device_id": "01:145038", "verb": "RQ", "code": "0004", "payload": "0100"},
+}
+TESTS_SEND_PACKET_FAIL: dict[str, dict[str, Any]] = {
+    "10": {"device_id": "18:00073"},  # #                              too short
+    "11": {"device_id": "18:0007300"},  # #                            too long
+    "12": {"device_id": "18:000730\n"},  # #                           trailing newline
+    "13": {"device_id": 18000730},  # #                               not a string
+    "20": {"code": "1FC"},  # #                                        too short
+    "21": {"code": "1FC9\n"},  # #                                     trailing newline
+    "30": {"payload": "000"},  # #                                     odd length
+    "31": {"payload": "00" * 49},  # #                                 too long
+    "32": {"payload": "00\n"},  # #                                    trailing newline
+}
+
+
+@pytest.mark.parametrize("idx", TESTS_SEND_PACKET_GOOD)
+def test_send_packet_schema_good(idx: str) -> None:
+    data = {**_SEND_PACKET_GOOD, **TESTS_SEND_PACKET_GOOD[idx]}
+
+    assert SCH_SEND_PACKET(data) == data
+
+
+@pytest.mark.parametrize("idx", TESTS_SEND_PACKET_FAIL)
+def test_send_packet_schema_fail(idx: str) -> None:
+    data = {**_SEND_PACKET_GOOD, **TESTS_SEND_PACKET_FAIL[idx]}
+
+    try:
+        SCH_SEND_PACKET(data)
+    except vol.MultipleInvalid:
+        pass
+    else:
+        raise AssertionError("Expected vol.MultipleInvalid")